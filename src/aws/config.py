@@ -10,74 +10,99 @@ import subprocess
 import sys
 from typing import Optional, List, Dict, Any
 from pathlib import Path
+from dataclasses import dataclass, field
 from botocore.exceptions import NoCredentialsError, ProfileNotFound, ClientError
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class Profiles:
+    """AWS profiles parsed from the config file, stored as parallel lists"""
+    names: List[str] = field(default_factory=list)
+    is_sso: List[bool] = field(default_factory=list)
+    sso_urls: List[Optional[str]] = field(default_factory=list)
+    index: Dict[str, int] = field(default_factory=dict)
+    
+    def sso_url(self, profile_name: str) -> Optional[str]:
+        """Get the SSO start URL for a profile, or None"""
+        i = self.index.get(profile_name)
+        return self.sso_urls[i] if i is not None else None
+
 class AWSProfileManager:
     """AWS Profile Management with SSO support"""
     
     def __init__(self):
         self.config_file = Path.home() / ".aws" / "config"
         self.credentials_file = Path.home() / ".aws" / "credentials"
+        self._profiles: Optional[Profiles] = None
+        self._profiles_mtime: Optional[int] = None
         
-    def get_profiles(self) -> List[str]:
-        """Get all AWS profiles from config file"""
+    def load_once(self) -> Profiles:
+        """Parse the config file once and reuse the result until it changes"""
+        try:
+            mtime = self.config_file.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+            
+        if self._profiles is None or mtime != self._profiles_mtime:
+            self._profiles = self._parse_config()
+            self._profiles_mtime = mtime
+        return self._profiles
+    
+    def invalidate(self):
+        """Drop the parsed profiles so the next access re-reads the config"""
+        self._profiles = None
+        self._profiles_mtime = None
+        
+    def _parse_config(self) -> Profiles:
+        """Read profile names and SSO start URLs in a single pass"""
+        profiles = Profiles()
         if not self.config_file.exists():
             logger.warning(f"AWS config file not found at {self.config_file}")
-            return []
+            return profiles
             
-        profiles = []
         try:
             with open(self.config_file, 'r') as f:
+                current = None
                 for line in f:
-                    if line.strip().startswith('[profile '):
-                        profile_name = line.strip()[9:-1]  # Remove '[profile ' and ']'
-                        profiles.append(profile_name)
+                    line = line.strip()
+                    if line.startswith('[profile '):
+                        profile_name = line[9:-1]  # Remove '[profile ' and ']'
+                        current = len(profiles.names)
+                        profiles.names.append(profile_name)
+                        profiles.is_sso.append(False)
+                        profiles.sso_urls.append(None)
+                        profiles.index.setdefault(profile_name, current)
+                    elif current is not None and line.startswith('sso_start_url'):
+                        if profiles.sso_urls[current] is None:
+                            url = line.split('=', 1)[1].strip()
+                            profiles.sso_urls[current] = url
+                            # An empty start URL doesn't make the profile SSO
+                            profiles.is_sso[current] = bool(url)
         except Exception as e:
             logger.error(f"Error reading AWS config file: {e}")
             
         return profiles
+        
+    def get_profiles(self) -> List[str]:
+        """Get all AWS profiles from config file"""
+        return list(self.load_once().names)
     
     def get_profile_sso_url(self, profile_name: str) -> Optional[str]:
         """Get SSO start URL for a profile"""
-        if not self.config_file.exists():
-            return None
-            
-        try:
-            with open(self.config_file, 'r') as f:
-                lines = f.readlines()
-                
-            in_profile = False
-            for line in lines:
-                line = line.strip()
-                if line == f'[profile {profile_name}]':
-                    in_profile = True
-                    continue
-                elif line.startswith('[profile '):
-                    in_profile = False
-                elif in_profile and line.startswith('sso_start_url'):
-                    return line.split('=', 1)[1].strip()
-                    
-        except Exception as e:
-            logger.error(f"Error reading SSO URL for profile {profile_name}: {e}")
-            
-        return None
+        return self.load_once().sso_url(profile_name)
     
     def group_profiles_by_sso(self) -> Dict[str, Any]:
         """Group profiles by SSO URL"""
-        profiles = self.get_profiles()
+        profiles = self.load_once()
         sso_groups = {}
         non_sso_profiles = []
         
-        for profile in profiles:
-            sso_url = self.get_profile_sso_url(profile)
-            if sso_url:
-                if sso_url not in sso_groups:
-                    sso_groups[sso_url] = []
-                sso_groups[sso_url].append(profile)
+        for name, is_sso, sso_url in zip(profiles.names, profiles.is_sso, profiles.sso_urls):
+            if is_sso:
+                sso_groups.setdefault(sso_url, []).append(name)
             else:
-                non_sso_profiles.append(profile)
+                non_sso_profiles.append(name)
                 
         return {
             'sso_groups': sso_groups,
@@ -86,8 +111,7 @@ class AWSProfileManager:
     
     def validate_profile(self, profile_name: str) -> bool:
         """Validate if a profile exists and has valid configuration"""
-        profiles = self.get_profiles()
-        return profile_name in profiles
+        return profile_name in self.load_once().index
     
     def attempt_sso_login(self, profile_name: str) -> bool:
         """Attempt SSO login for a profile"""
@@ -3,7 +3,7 @@ AWS Profile Selection Dialog
 """
 
 import customtkinter as ctk
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 import logging
 
 from src.aws.config import AWSProfileManager
@@ -13,6 +13,19 @@ logger = logging.getLogger(__name__)
 class ProfileSelectionDialog(ctk.CTkToplevel):
     """Dialog for selecting AWS profile with SSO support"""
     
+    # Shared CTkFont objects keyed by (size, weight), created on first use
+    _fonts = {}
+    
+    @classmethod
+    def _font(cls, size: int, weight: str = "normal") -> ctk.CTkFont:
+        """Get a cached font, creating it on first request"""
+        key = (size, weight)
+        font = cls._fonts.get(key)
+        if font is None:
+            font = ctk.CTkFont(size=size, weight=weight)
+            cls._fonts[key] = font
+        return font
+    
     def __init__(self, master, on_profile_selected: Callable[[str], None]):
         super().__init__(master)
         
@@ -21,6 +34,9 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
         self.selected_profile = None
         self.profile_var = ctk.StringVar()  # Shared variable for all radio buttons
         
+        # Single pending cleanup for transient SSO messages: (after id, callback)
+        self._pending_cleanup: Optional[Tuple[str, Callable[[], None]]] = None
+        
         self._setup_window()
         self._create_widgets()
         self._setup_layout()
@@ -51,7 +67,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
         self.title_label = ctk.CTkLabel(
             self,
             text="Select AWS Profile",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self._font(20, "bold")
         )
         
         # Profile list frame
@@ -87,6 +103,9 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
         self.button_frame = ctk.CTkFrame(self)
         self.button_frame.pack(fill="x", side="bottom", padx=20, pady=20)
         
+        # Grid columns: utility buttons on the left, spacer, Cancel/Select on the right
+        self.button_frame.grid_columnconfigure(3, weight=1)
+        
         # IMPORTANT: Select Profile button first (most important)
         self.select_button = ctk.CTkButton(
             self.button_frame,
@@ -96,10 +115,10 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
             hover_color="darkgreen",
             width=140,
             height=35,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._font(12, "bold"),
             state="disabled"
         )
-        self.select_button.pack(side="right", padx=5, pady=5)
+        self.select_button.grid(row=0, column=5, padx=5, pady=5)
         
         # Cancel button (also important)
         self.cancel_button = ctk.CTkButton(
@@ -108,7 +127,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
             command=self.destroy,
             width=100
         )
-        self.cancel_button.pack(side="right", padx=5, pady=5)
+        self.cancel_button.grid(row=0, column=4, padx=5, pady=5)
         
         # Left side utility buttons
         self.refresh_button = ctk.CTkButton(
@@ -117,7 +136,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
             command=self._refresh_profiles,
             width=120
         )
-        self.refresh_button.pack(side="left", padx=5, pady=5)
+        self.refresh_button.grid(row=0, column=0, padx=5, pady=5)
         
         self.configure_button = ctk.CTkButton(
             self.button_frame,
@@ -125,7 +144,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
             command=self._configure_new_profile,
             width=150
         )
-        self.configure_button.pack(side="left", padx=5, pady=5)
+        self.configure_button.grid(row=0, column=1, padx=5, pady=5)
         
         self.manage_button = ctk.CTkButton(
             self.button_frame,
@@ -133,7 +152,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
             command=self._manage_profiles,
             width=130
         )
-        self.manage_button.pack(side="left", padx=5, pady=5)
+        self.manage_button.grid(row=0, column=2, padx=5, pady=5)
         
     def _load_profiles(self):
         """Load and display available profiles"""
@@ -144,56 +163,61 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
         
         # Get profile groups
         profile_groups = self.profile_manager.group_profiles_by_sso()
-        
-        # Show SSO groups
-        for sso_url, profiles in profile_groups['sso_groups'].items():
-            # SSO group header
-            sso_header = ctk.CTkLabel(
-                self.scrollable_frame,
-                text=f"SSO: {sso_url}",
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color="cyan"
-            )
-            sso_header.pack(anchor="w", padx=10, pady=(10, 5))
-            self.profile_widgets.append(sso_header)
-            
-            # SSO profiles
-            for profile in profiles:
-                profile_widget = self._create_profile_widget(profile, is_sso=True, sso_url=sso_url)
-                self.profile_widgets.append(profile_widget)
-        
-        # Show non-SSO profiles
-        if profile_groups['non_sso_profiles']:
-            # Non-SSO header
-            nonsso_header = ctk.CTkLabel(
-                self.scrollable_frame,
-                text="Non-SSO Profiles:",
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color="orange"
-            )
-            nonsso_header.pack(anchor="w", padx=10, pady=(10, 5))
-            self.profile_widgets.append(nonsso_header)
-            
-            # Non-SSO profiles
-            for profile in profile_groups['non_sso_profiles']:
-                profile_widget = self._create_profile_widget(profile, is_sso=False)
-                self.profile_widgets.append(profile_widget)
+        sso_groups = profile_groups['sso_groups']
+        non_sso_profiles = profile_groups['non_sso_profiles']
+        
+        # Flatten the groups into display rows: (kind, text, sso_url)
+        rows = [
+            row
+            for sso_url, profiles in sso_groups.items()
+            for row in [("sso_header", sso_url, None)] + [("sso", profile, sso_url) for profile in profiles]
+        ]
+        if non_sso_profiles:
+            rows.append(("non_sso_header", None, None))
+            rows.extend(("non_sso", profile, None) for profile in non_sso_profiles)
+        
+        # Create widgets for each row
+        append_widget = self.profile_widgets.append
+        for kind, text, sso_url in rows:
+            append_widget(self._create_profile_row(kind, text, sso_url))
         
         # Show message if no profiles found
-        if not profile_groups['sso_groups'] and not profile_groups['non_sso_profiles']:
+        if not rows:
             no_profiles_label = ctk.CTkLabel(
                 self.scrollable_frame,
                 text="No AWS profiles found.\nPlease configure a profile first.",
-                font=ctk.CTkFont(size=12),
+                font=self._font(12),
                 text_color="gray"
             )
             no_profiles_label.pack(pady=20)
             self.profile_widgets.append(no_profiles_label)
+        
+        # Resolve the geometry of all rows in a single pass
+        self.scrollable_frame.update_idletasks()
             
+    def _create_profile_row(self, kind: str, text: Optional[str], sso_url: Optional[str]):
+        """Create the widget for one flattened profile list row"""
+        if kind == "sso":
+            return self._create_profile_widget(text, is_sso=True, sso_url=sso_url)
+        if kind == "non_sso":
+            return self._create_profile_widget(text, is_sso=False)
+        
+        # Group header
+        is_sso_header = kind == "sso_header"
+        header = ctk.CTkLabel(
+            self.scrollable_frame,
+            text=f"SSO: {text}" if is_sso_header else "Non-SSO Profiles:",
+            font=self._font(14, "bold"),
+            text_color="cyan" if is_sso_header else "orange"
+        )
+        header.pack(anchor="w", padx=10, pady=(10, 5))
+        return header
+        
     def _create_profile_widget(self, profile_name: str, is_sso: bool, sso_url: str = None):
         """Create a profile selection widget"""
         profile_frame = ctk.CTkFrame(self.scrollable_frame)
         profile_frame.pack(fill="x", padx=10, pady=2)
+        profile_frame.grid_columnconfigure(2, weight=1)
         
         # Profile selection radio button
         radio_button = ctk.CTkRadioButton(
@@ -203,16 +227,16 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
             value=profile_name,
             command=lambda: self._on_profile_selection(profile_name)
         )
-        radio_button.pack(side="left", padx=10, pady=10)
+        radio_button.grid(row=0, column=0, padx=10, pady=10, sticky="w")
         
         # Profile type indicator
         type_label = ctk.CTkLabel(
             profile_frame,
             text="SSO" if is_sso else "Standard",
-            font=ctk.CTkFont(size=10),
+            font=self._font(10),
             text_color="cyan" if is_sso else "orange"
         )
-        type_label.pack(side="left", padx=10, pady=10)
+        type_label.grid(row=0, column=1, padx=10, pady=10, sticky="w")
         
         # SSO login button for SSO profiles
         if is_sso:
@@ -223,7 +247,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
                 width=60,
                 height=25
             )
-            login_button.pack(side="right", padx=10, pady=10)
+            login_button.grid(row=0, column=3, padx=10, pady=10, sticky="e")
         
         return profile_frame
         
@@ -241,10 +265,14 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
         
     def _sso_login(self, profile_name: str):
         """Attempt SSO login for a profile"""
+        # Drop any message left over from a previous login attempt
+        self._flush_pending_cleanup()
+        
         try:
             if self.select_button:
                 self.select_button.configure(state="disabled", text="Logging in...")
-            self.update()
+            # Flush pending redraws only; update() would also dispatch queued user events
+            self.update_idletasks()
             
             success = self.profile_manager.attempt_sso_login(profile_name)
             
@@ -257,7 +285,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
                     success_frame,
                     text=f"SSO login successful for '{profile_name}'",
                     text_color="green",
-                    font=ctk.CTkFont(size=12, weight="bold")
+                    font=self._font(12, "bold")
                 )
                 success_label.pack(pady=10, padx=10)
                 
@@ -277,7 +305,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
                 auto_use_label = ctk.CTkLabel(
                     auto_use_frame,
                     text=f"Profile '{profile_name}' is now ready to use.",
-                    font=ctk.CTkFont(size=12)
+                    font=self._font(12)
                 )
                 auto_use_label.pack(side="left", padx=10, pady=5)
                 
@@ -293,7 +321,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
                 use_now_button.pack(side="right", padx=10, pady=5)
                 
                 # Clean up after 10 seconds if not used
-                self.after(10000, lambda: self._cleanup_success_widgets(success_frame, auto_use_frame))
+                self._schedule_cleanup(10000, lambda: self._cleanup_success_widgets(success_frame, auto_use_frame))
             else:
                 # Show error message
                 error_label = ctk.CTkLabel(
@@ -302,7 +330,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
                     text_color="red"
                 )
                 error_label.pack(pady=5)
-                self.after(3000, error_label.destroy)
+                self._schedule_cleanup(3000, error_label.destroy)
                 
         except Exception as e:
             logger.error(f"SSO login error: {e}")
@@ -312,7 +340,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
                 text_color="red"
             )
             error_label.pack(pady=5)
-            self.after(3000, error_label.destroy)
+            self._schedule_cleanup(3000, error_label.destroy)
         finally:
             if self.select_button:
                 self.select_button.configure(state="normal", text="Select Profile")
@@ -328,6 +356,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
                 text="Select Profile"
             )
         self.title("Select AWS Profile")
+        self.profile_manager.invalidate()
         self._load_profiles()
         
     def _configure_new_profile(self):
@@ -349,7 +378,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
         title_label = ctk.CTkLabel(
             config_dialog,
             text="Configure New AWS Profile",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(16, "bold")
         )
         title_label.pack(pady=20)
         
@@ -357,7 +386,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
         instructions = ctk.CTkLabel(
             config_dialog,
             text="Choose the type of AWS profile to configure:",
-            font=ctk.CTkFont(size=12)
+            font=self._font(12)
         )
         instructions.pack(pady=10)
         
@@ -457,7 +486,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
         title_label = ctk.CTkLabel(
             mgmt_dialog,
             text="Manage AWS Profiles",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(16, "bold")
         )
         title_label.pack(pady=20)
         
@@ -465,12 +494,12 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
         profiles_frame = ctk.CTkScrollableFrame(mgmt_dialog, width=450, height=200)
         profiles_frame.pack(pady=10, padx=20, fill="both", expand=True)
         
-        # Get all profiles
-        all_profiles = self.profile_manager.get_profiles()
+        # Get all profiles (parsed once and shared with the other views)
+        all_profiles = self.profile_manager.load_once()
         selected_profile_var = ctk.StringVar()
         
-        if all_profiles:
-            for profile in all_profiles:
+        if all_profiles.names:
+            for profile, is_sso in zip(all_profiles.names, all_profiles.is_sso):
                 profile_frame = ctk.CTkFrame(profiles_frame)
                 profile_frame.pack(fill="x", padx=5, pady=2)
                 
@@ -484,13 +513,11 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
                 radio.pack(side="left", padx=10, pady=5)
                 
                 # Profile type
-                sso_url = self.profile_manager.get_profile_sso_url(profile)
-                type_text = "SSO" if sso_url else "Standard"
                 type_label = ctk.CTkLabel(
                     profile_frame,
-                    text=type_text,
-                    text_color="cyan" if sso_url else "orange",
-                    font=ctk.CTkFont(size=10)
+                    text="SSO" if is_sso else "Standard",
+                    text_color="cyan" if is_sso else "orange",
+                    font=self._font(10)
                 )
                 type_label.pack(side="right", padx=10, pady=5)
         else:
@@ -576,7 +603,7 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
         msg_label = ctk.CTkLabel(
             confirm_dialog,
             text=f"Are you sure you want to delete profile '{profile_name}'?\n\nThis action cannot be undone.",
-            font=ctk.CTkFont(size=12)
+            font=self._font(12)
         )
         msg_label.pack(pady=30)
         
@@ -626,11 +653,8 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
         
     def _rename_aws_profile(self, old_name, new_name):
         """Rename AWS profile in config files"""
-        import os
-        from pathlib import Path
-        
-        config_file = Path.home() / ".aws" / "config"
-        cred_file = Path.home() / ".aws" / "credentials"
+        config_file = self.profile_manager.config_file
+        cred_file = self.profile_manager.credentials_file
         
         # Update config file
         if config_file.exists():
@@ -643,15 +667,15 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
             content = cred_file.read_text()
             updated_content = content.replace(f"[{old_name}]", f"[{new_name}]")
             cred_file.write_text(updated_content)
+        
+        self.profile_manager.invalidate()
     
     def _delete_aws_profile(self, profile_name):
         """Delete AWS profile from config files"""
-        import os
         import re
-        from pathlib import Path
         
-        config_file = Path.home() / ".aws" / "config"
-        cred_file = Path.home() / ".aws" / "credentials"
+        config_file = self.profile_manager.config_file
+        cred_file = self.profile_manager.credentials_file
         
         # Remove from config file
         if config_file.exists():
@@ -668,11 +692,14 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
             pattern = rf"\[{re.escape(profile_name)}\][^\[]*"
             updated_content = re.sub(pattern, "", content, flags=re.MULTILINE)
             cred_file.write_text(updated_content.strip())
+        
+        self.profile_manager.invalidate()
     
     def _use_profile_now(self, profile_name: str, success_frame, auto_use_frame):
         """Immediately use the selected profile after SSO login"""
         try:
-            # Clean up the success widgets
+            # Clean up the success widgets; the pending timer would only do the same
+            self._cancel_pending_cleanup()
             self._cleanup_success_widgets(success_frame, auto_use_frame)
             
             # Trigger the profile selection
@@ -683,6 +710,40 @@ class ProfileSelectionDialog(ctk.CTkToplevel):
             logger.error(f"Failed to use profile {profile_name}: {e}")
             self._show_temp_message(self, f"Failed to use profile: {e}", "red")
     
+    def _schedule_cleanup(self, delay_ms: int, callback: Callable[[], None]):
+        """Schedule a cleanup, flushing any previously pending one first"""
+        self._flush_pending_cleanup()
+        
+        def run_cleanup():
+            self._pending_cleanup = None
+            callback()
+        
+        self._pending_cleanup = (self.after(delay_ms, run_cleanup), callback)
+    
+    def _cancel_pending_cleanup(self) -> Optional[Callable[[], None]]:
+        """Cancel the pending cleanup timer without running it, returning its callback"""
+        if self._pending_cleanup is None:
+            return None
+            
+        handle, callback = self._pending_cleanup
+        self._pending_cleanup = None
+        self.after_cancel(handle)
+        return callback
+    
+    def _flush_pending_cleanup(self):
+        """Cancel the pending cleanup timer and run its callback immediately"""
+        callback = self._cancel_pending_cleanup()
+        if callback:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Pending cleanup failed: {e}")
+    
+    def destroy(self):
+        """Cancel the pending cleanup so it can't fire against a closed dialog"""
+        self._cancel_pending_cleanup()
+        super().destroy()
+    
     def _cleanup_success_widgets(self, success_frame, auto_use_frame):
         """Clean up success message widgets"""
         try:
@@ -3,8 +3,9 @@ Progress Tracking Component
 """
 
 import customtkinter as ctk
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Dict
 import logging
+import queue
 import threading
 import time
 
@@ -15,13 +16,27 @@ logger = logging.getLogger(__name__)
 class ProgressDialog(ctk.CTkToplevel):
     """Progress dialog for bulk operations"""
     
+    # Interval for draining queued progress updates (~25 Hz)
+    UPDATE_INTERVAL_MS = 40
+    
     def __init__(self, master, title: str, total_servers: int):
         super().__init__(master)
         
-        self.title = title
+        self.operation_title = title
         self.total_servers = total_servers
         self.progress = BulkOperationProgress(total_servers=total_servers)
         self.is_cancelled = False
+        # Result list shown in the text box and how many of its entries are rendered
+        self._rendered_results: Optional[List[BulkOperationResult]] = None
+        self._results_rendered = 0
+        
+        # Last values applied to the progress widgets, to skip no-op configure() calls
+        self._last_texts: Dict[str, str] = {}
+        self._last_fraction = 0.0
+        
+        # Progress updates posted from worker threads, drained on the Tk thread
+        self._progress_queue: "queue.SimpleQueue[BulkOperationProgress]" = queue.SimpleQueue()
+        self._poll_after_id: Optional[str] = None
         
         self._setup_window()
         self._create_widgets()
@@ -29,7 +44,7 @@ class ProgressDialog(ctk.CTkToplevel):
         
     def _setup_window(self):
         """Configure dialog window"""
-        self.title(f"{self.title}... (0/{self.total_servers} completed)")
+        self.title(f"{self.operation_title}... (0/{self.total_servers} completed)")
         self.geometry("600x400")
         self.resizable(False, False)
         
@@ -37,6 +52,9 @@ class ProgressDialog(ctk.CTkToplevel):
         self.transient(self.master)
         self.grab_set()
         
+        # Start draining progress updates
+        self._poll_after_id = self.after(self.UPDATE_INTERVAL_MS, self._poll_queue)
+        
     def _create_widgets(self):
         """Create dialog widgets"""
         
@@ -132,47 +150,96 @@ class ProgressDialog(ctk.CTkToplevel):
         self.hide_button.pack(side="right", padx=10, pady=10)
         
     def update_progress(self, progress: BulkOperationProgress):
-        """Update progress display"""
+        """Queue a progress update (safe to call from any thread)"""
+        self._progress_queue.put(progress)
+        
+    def _poll_queue(self):
+        """Apply the most recent queued progress and reschedule"""
+        self._poll_after_id = None
+        latest = None
+        try:
+            while True:
+                latest = self._progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+            
+        if latest is not None:
+            self._apply_progress(latest)
+            
+        if not self.progress.is_complete:
+            self._poll_after_id = self.after(self.UPDATE_INTERVAL_MS, self._poll_queue)
+            
+    def _apply_progress(self, progress: BulkOperationProgress):
+        """Update progress display (Tk thread only)"""
         self.progress = progress
+        pct = progress.progress_percentage
         
-        # Update progress bar
-        self.progress_bar.set(progress.progress_percentage / 100)
+        # Update progress bar (skip changes too small to see)
+        fraction = pct / 100
+        if abs(fraction - self._last_fraction) >= 0.005 or (fraction == 1 and self._last_fraction != 1):
+            self.progress_bar.set(fraction)
+            self._last_fraction = fraction
         
         # Update progress text
-        self.progress_text.configure(
-            text=f"Progress: {progress.progress_percentage:.1f}%"
-        )
+        self._set_text(self.progress_text, "progress_text", f"Progress: {pct:.1f}%")
         
         # Update status labels
-        self.completed_label.configure(text=f"Completed: {progress.completed}")
-        self.successful_label.configure(text=f"Successful: {progress.successful}")
-        self.failed_label.configure(text=f"Failed: {progress.failed}")
-        self.in_progress_label.configure(text=f"In Progress: {progress.in_progress}")
+        self._set_text(self.completed_label, "completed", f"Completed: {progress.completed}")
+        self._set_text(self.successful_label, "successful", f"Successful: {progress.successful}")
+        self._set_text(self.failed_label, "failed", f"Failed: {progress.failed}")
+        self._set_text(self.in_progress_label, "in_progress", f"In Progress: {progress.in_progress}")
         
         # Update results text
         self._update_results_display()
         
         # Update window title
-        self.title(f"{self.title}... ({progress.completed}/{self.total_servers} completed)")
+        title = f"{self.operation_title}... ({progress.completed}/{self.total_servers} completed)"
+        if self._last_texts.get("title") != title:
+            self.title(title)
+            self._last_texts["title"] = title
         
         # Check if operation is complete
         if progress.is_complete:
             self._on_operation_complete()
             
+    def _set_text(self, widget, key: str, text: str):
+        """Configure widget text only when it differs from the last value set"""
+        if self._last_texts.get(key) != text:
+            widget.configure(text=text)
+            self._last_texts[key] = text
+            
     def _update_results_display(self):
-        """Update the results text display"""
-        self.results_text.configure(state="normal")
-        self.results_text.delete("1.0", "end")
-        
-        for result in self.progress.results:
+        """Append newly arrived results to the text display"""
+        results = self.progress.results
+        if results is not self._rendered_results or len(results) < self._results_rendered:
+            # A different result set replaced the old one (or it was cleared); start over
+            self._clear_results_display()
+            self._rendered_results = results
+            
+        new_results = results[self._results_rendered:]
+        if not new_results:
+            return
+            
+        lines = []
+        for result in new_results:
             status_icon = "✅" if result.success else "❌"
             instance_info = f" ({result.instance_id})" if result.instance_id else ""
             error_info = f" - {result.error_message}" if result.error_message else ""
             
-            line = f"{status_icon} {result.server_name}{instance_info}{error_info}\n"
-            self.results_text.insert("end", line)
-            
+            lines.append(f"{status_icon} {result.server_name}{instance_info}{error_info}\n")
+        
+        # Append all new lines in one insert to avoid a redisplay per line
+        self.results_text.configure(state="normal")
+        self.results_text.insert("end", "".join(lines))
         self.results_text.configure(state="disabled")
+        self._results_rendered = len(results)
+        
+    def _clear_results_display(self):
+        """Clear the results text display"""
+        self.results_text.configure(state="normal")
+        self.results_text.delete("1.0", "end")
+        self.results_text.configure(state="disabled")
+        self._results_rendered = 0
         
     def _on_operation_complete(self):
         """Handle operation completion"""
@@ -183,6 +250,7 @@ class ProgressDialog(ctk.CTkToplevel):
         self.hide_button.configure(text="Close")
         
         # Show completion message
+        self._last_texts.pop("progress_text", None)
         if self.progress.failed == 0:
             self.progress_text.configure(
                 text=f"✅ Operation completed successfully! ({self.progress.successful}/{self.total_servers})",
@@ -205,6 +273,13 @@ class ProgressDialog(ctk.CTkToplevel):
         self.cancel_button.configure(state="disabled", text="Cancelling...")
         logger.info("Operation cancellation requested")
         
+    def destroy(self):
+        """Stop polling for progress before destroying the dialog"""
+        if self._poll_after_id is not None:
+            self.after_cancel(self._poll_after_id)
+            self._poll_after_id = None
+        super().destroy()
+        
     def _hide_dialog(self):
         """Hide the dialog"""
         if self.progress.is_complete:
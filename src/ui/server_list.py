@@ -2,26 +2,173 @@
 Server List Component
 """
 
+import sys
+import tkinter
 import customtkinter as ctk
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Dict, Tuple
 import logging
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 
 from src.models.server import SourceServer, ServerStatus, ServerFilter
 
 logger = logging.getLogger(__name__)
 
+# (icon, user-friendly label) per status
+_STATUS_ENTRIES: Dict[ServerStatus, Tuple[str, str]] = {
+    # Ready states - Green
+    ServerStatus.READY_FOR_TEST: ("🟢", "Ready for Test"),
+    ServerStatus.READY_FOR_TESTING: ("🟢", "Ready for Testing"),
+    ServerStatus.READY_FOR_CUTOVER: ("🟢", "Ready for Cutover"),
+    
+    # In Progress states - Yellow
+    ServerStatus.TEST_IN_PROGRESS: ("🟡", "Test in Progress"),
+    ServerStatus.CUTOVER_IN_PROGRESS: ("🟡", "Cutover in Progress"),
+    
+    # Success states - Blue
+    ServerStatus.TEST_COMPLETE: ("🔵", "Test Complete"),
+    ServerStatus.TEST_COMPLETED: ("🔵", "Test Completed"),
+    ServerStatus.CUTOVER_COMPLETE: ("🔵", "Cutover Complete"),
+    ServerStatus.CUTOVER_COMPLETED: ("🔵", "Cutover Completed"),
+    
+    # Failed/Error states - Red
+    ServerStatus.TEST_FAILED: ("🔴", "Test Failed"),
+    ServerStatus.CUTOVER_FAILED: ("🔴", "Cutover Failed"),
+    ServerStatus.STALLED: ("🔴", "Stalled"),
+    ServerStatus.ERROR: ("🔴", "Error"),
+    
+    # Other states - Gray
+    ServerStatus.NOT_READY: ("⚫", "Not Ready"),
+    ServerStatus.DISCONNECTED: ("⚫", "Disconnected"),
+    ServerStatus.STOPPED: ("⚫", "Stopped"),
+    ServerStatus.UNKNOWN: ("⚪", "Unknown")
+}
+
+# Interned "icon label" text per status, so repeated row texts are the same object
+_STATUS_FMT: Dict[ServerStatus, str] = {
+    status: sys.intern(f"{icon} {label}") for status, (icon, label) in _STATUS_ENTRIES.items()
+}
+
+# Status filter option per status; alias statuses share a single option
+_STATUS_TO_DISPLAY: Dict[ServerStatus, str] = {
+    **{status: label for status, (icon, label) in _STATUS_ENTRIES.items()},
+    ServerStatus.TEST_COMPLETE: "Test Completed",
+    ServerStatus.CUTOVER_COMPLETE: "Cutover Completed"
+}
+
+# Status filter option -> server statuses it matches (inverse of the above)
+_DISPLAY_TO_STATUSES: Dict[str, Tuple[ServerStatus, ...]] = {}
+for _status, _display in _STATUS_TO_DISPLAY.items():
+    _DISPLAY_TO_STATUSES[_display] = _DISPLAY_TO_STATUSES.get(_display, ()) + (_status,)
+del _status, _display
+
+
+def _format_last_seen(last_seen: Optional[datetime], now: datetime) -> str:
+    """Format a last seen timestamp relative to now (a UTC-aware datetime)"""
+    if not last_seen:
+        return "Unknown"
+        
+    try:
+        # Ensure the server's last seen time is timezone-aware
+        if last_seen.tzinfo is None:
+            # If it's naive, assume it's UTC
+            last_seen = last_seen.replace(tzinfo=timezone.utc)
+        
+        diff = now - last_seen
+        
+        if diff.days > 0:
+            return f"{diff.days} day(s) ago"
+        elif diff.seconds > 3600:
+            hours = diff.seconds // 3600
+            return f"{hours} hour(s) ago"
+        elif diff.seconds > 60:
+            minutes = diff.seconds // 60
+            return f"{minutes} min ago"
+        else:
+            return "Just now"
+            
+    except Exception as e:
+        logger.warning(f"Error calculating time difference: {e}")
+        # Fallback to showing the raw timestamp
+        try:
+            return last_seen.strftime("%Y-%m-%d %H:%M")
+        except:
+            return "Unknown"
+
+
+def _filter_server_indices(
+    count: int,
+    status_index: Dict[ServerStatus, List[int]],
+    name_lower: List[str],
+    id_lower: List[str],
+    status_name: str,
+    search_term: str
+) -> List[int]:
+    """Get indices of servers matching a status option and a lowercase search term"""
+    # Status filter: start from the pre-indexed matches only
+    if status_name == "All":
+        candidates = range(count)
+    else:
+        expected_statuses = _DISPLAY_TO_STATUSES.get(status_name, ())
+        candidates = sorted(
+            i for status in expected_statuses for i in status_index.get(status, ())
+        )
+    
+    # Search filter
+    if search_term:
+        return [
+            i for i in candidates
+            if search_term in name_lower[i] or search_term in id_lower[i]
+        ]
+    return list(candidates)
+
+
 class ServerListFrame(ctk.CTkFrame):
     """Server list with filtering and multi-select capabilities"""
     
+    # Vertical padding between rows and extra rows rendered beyond the viewport
+    ROW_PADDING = 4
+    ROW_BUFFER = 2
+    
+    # Delay before re-filtering after search/status input, to coalesce keystrokes
+    FILTER_DEBOUNCE_MS = 120
+    
+    # How often relative "last seen" times are recomputed
+    LAST_SEEN_REFRESH_MS = 30000
+    
+    # Server count above which filtering runs on a worker thread, and how
+    # often the Tk thread checks for its result
+    BACKGROUND_FILTER_THRESHOLD = 2000
+    FILTER_POLL_MS = 10
+    
     def __init__(self, master, on_selection_change: Callable[[List[SourceServer]], None]):
         super().__init__(master)
         
         self.on_selection_change = on_selection_change
         self.servers: List[SourceServer] = []
         self.filtered_servers: List[SourceServer] = []
-        self.selected_servers: List[SourceServer] = []
+        # Selected servers keyed by source_server_id (insertion ordered)
+        self._selected: Dict[str, SourceServer] = {}
         self.current_filter = ServerFilter()
+        self._search_after_id: Optional[str] = None
+        self._last_search = ""
+        
+        # Filter indices, rebuilt in update_servers
+        self._name_lower: List[str] = []
+        self._id_lower: List[str] = []
+        self._status_index: Dict[ServerStatus, List[int]] = {}
+        
+        # Worker used to filter very large server lists off the Tk thread
+        self._filter_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="server-filter")
+        self._filter_future: Optional[Future] = None
+        self._filter_poll_after_id: Optional[str] = None
+        
+        # Status filter options currently shown in the dropdown
+        self._last_options: Tuple[str, ...] = ("All",)
+        
+        # Last seen text per server id, refreshed every LAST_SEEN_REFRESH_MS
+        self._last_seen_text: Dict[str, str] = {}
+        self._last_seen_after_id: Optional[str] = None
         
         self._create_widgets()
         self._setup_layout()
@@ -49,7 +196,7 @@ class ServerListFrame(ctk.CTkFrame):
             self.filter_frame,
             variable=self.status_var,
             values=["All"],  # Will be updated dynamically
-            command=self._apply_filters
+            command=self._schedule_filters
         )
         self.status_filter.pack(side="left", padx=5, pady=5)
         
@@ -65,7 +212,7 @@ class ServerListFrame(ctk.CTkFrame):
             width=200
         )
         self.search_entry.pack(side="left", padx=5, pady=5)
-        self.search_entry.bind("<KeyRelease>", self._on_search_change)
+        self.search_var.trace_add("write", self._on_search_change)
         
         # Selection controls
         self.select_all_button = ctk.CTkButton(
@@ -91,64 +238,96 @@ class ServerListFrame(ctk.CTkFrame):
         # Server list frame
         self.list_frame = ctk.CTkFrame(self)
         
-        # Create scrollable frame for server list
-        self.scrollable_frame = ctk.CTkScrollableFrame(
+        # Virtualized server list: a canvas holding only the rows in view
+        self.canvas = ctk.CTkCanvas(
             self.list_frame,
             width=800,
-            height=400
+            height=400,
+            highlightthickness=0,
+            bg=self.list_frame._apply_appearance_mode(self.list_frame.cget("fg_color"))
         )
+        self.scrollbar = ctk.CTkScrollbar(self.list_frame, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_canvas_yview)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self._bind_mousewheel(self.canvas)
+        
+        # Header row (created once and kept above the canvas so it stays frozen)
+        self.header_row = ServerRowWidget(self.list_frame, is_header=True, on_checkbox_change=None)
         
-        # Server list (will be populated dynamically)
-        self.server_widgets: List[ServerRowWidget] = []
+        # Pool of reusable row widgets and their canvas window ids
+        self._row_pool: List[ServerRowWidget] = []
+        self._row_windows: List[int] = []
+        self._row_height: Optional[int] = None
+        self._first_rendered: Optional[int] = None
         
     def _setup_layout(self):
         """Setup the layout"""
         self.filter_frame.pack(fill="x", padx=5, pady=5)
         self.list_frame.pack(fill="both", expand=True, padx=5, pady=5)
-        self.scrollable_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        # Header shares the canvas column so its labels line up with the rows
+        self.list_frame.grid_columnconfigure(0, weight=1)
+        self.list_frame.grid_rowconfigure(1, weight=1)
+        self.header_row.grid(row=0, column=0, sticky="ew", padx=5, pady=(5, 0))
+        self.canvas.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        self.scrollbar.grid(row=1, column=1, sticky="ns", padx=(0, 5), pady=5)
+        
+    @property
+    def selected_servers(self) -> List[SourceServer]:
+        """Currently selected servers, in selection order"""
+        return list(self._selected.values())
         
     def update_servers(self, servers: List[SourceServer]):
         """Update the server list"""
         self.servers = servers
+        self._index_servers()
+        self._compute_last_seen()
         self._update_status_filter_options()
         self._apply_filters()
         
+    def _index_servers(self):
+        """Precompute normalized search fields and per-status indices"""
+        self._name_lower = [server.name.lower() for server in self.servers]
+        self._id_lower = [server.source_server_id.lower() for server in self.servers]
+        self._status_index = {}
+        for i, server in enumerate(self.servers):
+            self._status_index.setdefault(server.status, []).append(i)
+        
+    def _compute_last_seen(self):
+        """Precompute last seen text for every server and schedule a refresh"""
+        now = datetime.now(timezone.utc)
+        self._last_seen_text = {
+            server.source_server_id: _format_last_seen(server.last_seen_date_time, now)
+            for server in self.servers
+        }
+        
+        if self._last_seen_after_id is not None:
+            self.after_cancel(self._last_seen_after_id)
+        self._last_seen_after_id = self.after(self.LAST_SEEN_REFRESH_MS, self._refresh_last_seen)
+        
+    def _refresh_last_seen(self):
+        """Keep relative last seen times current for the visible rows"""
+        self._last_seen_after_id = None
+        self._compute_last_seen()
+        self._render_visible_rows(force=True)
+        
     def _update_status_filter_options(self):
         """Update status filter options based on actual server statuses"""
         if not self.servers:
             return
             
-        # Get unique statuses from current servers
-        unique_statuses = set(server.status for server in self.servers)
-        
-        # Map server statuses to display names
-        status_display_map = {
-            ServerStatus.READY_FOR_TEST: "Ready for Test",
-            ServerStatus.READY_FOR_TESTING: "Ready for Testing", 
-            ServerStatus.READY_FOR_CUTOVER: "Ready for Cutover",
-            ServerStatus.TEST_IN_PROGRESS: "Test in Progress",
-            ServerStatus.CUTOVER_IN_PROGRESS: "Cutover in Progress",
-            ServerStatus.TEST_COMPLETE: "Test Complete",
-            ServerStatus.TEST_COMPLETED: "Test Completed",
-            ServerStatus.CUTOVER_COMPLETE: "Cutover Complete",
-            ServerStatus.CUTOVER_COMPLETED: "Cutover Completed",
-            ServerStatus.TEST_FAILED: "Test Failed",
-            ServerStatus.CUTOVER_FAILED: "Cutover Failed",
-            ServerStatus.NOT_READY: "Not Ready",
-            ServerStatus.DISCONNECTED: "Disconnected",
-            ServerStatus.STALLED: "Stalled",
-            ServerStatus.ERROR: "Error",
-            ServerStatus.STOPPED: "Stopped",
-            ServerStatus.UNKNOWN: "Unknown"
-        }
-        
-        # Build list of options starting with "All"
+        # Add status options that actually exist in the data, starting with "All"
         options = ["All"]
-        
-        # Add status options that actually exist in the data
-        for status in sorted(unique_statuses, key=lambda x: x.value):
-            display_name = status_display_map.get(status, status.value.replace('_', ' ').title())
-            options.append(display_name)
+        for status in sorted(self._status_index, key=lambda x: x.value):
+            display_name = _STATUS_TO_DISPLAY.get(status, status.value.replace('_', ' ').title())
+            if display_name not in options:
+                options.append(display_name)
+        
+        # Skip rebuilding the dropdown when the options are the same as last time
+        new_options = tuple(options)
+        if new_options == self._last_options:
+            return
+        self._last_options = new_options
         
         # Update the dropdown
         current_value = self.status_var.get()
@@ -160,91 +339,200 @@ class ServerListFrame(ctk.CTkFrame):
         
     def _apply_filters(self, *args):
         """Apply current filters to server list"""
-        self.filtered_servers = []
+        servers = self.servers
+        status_name = self.status_var.get()
+        search_term = self.search_var.get().lower()
         
-        for server in self.servers:
-            if self._matches_filter(server):
-                self.filtered_servers.append(server)
-                
-        self._update_server_list()
-        self._update_count_label()
+        # Any in-flight background pass is now stale
+        self._cancel_background_filter()
+            
+        # Default view: no filtering needed, show the server list as-is
+        if status_name == "All" and not search_term:
+            self.filtered_servers = servers
+            self._update_server_list()
+            self._update_count_label()
+            return
         
-    def _matches_filter(self, server: SourceServer) -> bool:
-        """Check if server matches current filter"""
+        filter_args = (
+            len(servers),
+            self._status_index,
+            self._name_lower,
+            self._id_lower,
+            status_name,
+            search_term
+        )
         
-        # Status filter
-        if self.status_var.get() != "All":
-            status_map = {
-                "Ready for Test": ServerStatus.READY_FOR_TEST,
-                "Ready for Testing": ServerStatus.READY_FOR_TESTING,
-                "Ready for Cutover": ServerStatus.READY_FOR_CUTOVER,
-                "Test in Progress": ServerStatus.TEST_IN_PROGRESS,
-                "Test Completed": [ServerStatus.TEST_COMPLETE, ServerStatus.TEST_COMPLETED],
-                "Test Failed": ServerStatus.TEST_FAILED,
-                "Cutover in Progress": ServerStatus.CUTOVER_IN_PROGRESS,
-                "Cutover Completed": [ServerStatus.CUTOVER_COMPLETE, ServerStatus.CUTOVER_COMPLETED],
-                "Cutover Failed": ServerStatus.CUTOVER_FAILED,
-                "Stalled": ServerStatus.STALLED,
-                "Disconnected": ServerStatus.DISCONNECTED,
-                "Not Ready": ServerStatus.NOT_READY,
-                "Error": ServerStatus.ERROR
-            }
+        if len(servers) <= self.BACKGROUND_FILTER_THRESHOLD:
+            self._install_filter_result(servers, _filter_server_indices(*filter_args))
+            return
             
-            expected_status = status_map.get(self.status_var.get())
-            if expected_status is None:
-                return False
+        # Large lists are filtered off the Tk thread; the index lists are
+        # replaced (never mutated) on update, so passing them is a safe snapshot
+        future = self._filter_executor.submit(_filter_server_indices, *filter_args)
+        self._filter_future = future
+        self._filter_poll_after_id = self.after(self.FILTER_POLL_MS, self._poll_filter_future, future, servers)
+        
+    def _poll_filter_future(self, future: Future, servers: List[SourceServer]):
+        """Install a background filter result once it is ready"""
+        if future is not self._filter_future:
+            return  # Superseded by newer input; the id belongs to the newer poll
+        self._filter_poll_after_id = None
+        if not future.done():
+            self._filter_poll_after_id = self.after(self.FILTER_POLL_MS, self._poll_filter_future, future, servers)
+            return
             
-            if isinstance(expected_status, list):
-                if server.status not in expected_status:
-                    return False
-            elif server.status != expected_status:
-                return False
-        
-        # Search filter
-        search_term = self.search_var.get().lower()
-        if search_term:
-            if (search_term not in server.name.lower() and 
-                search_term not in server.source_server_id.lower()):
-                return False
+        self._filter_future = None
+        try:
+            indices = future.result()
+        except Exception as e:
+            logger.error(f"Server filter failed: {e}")
+            return
+        self._install_filter_result(servers, indices)
+        
+    def _cancel_background_filter(self):
+        """Cancel the in-flight background filter pass and its pending poll"""
+        if self._filter_poll_after_id is not None:
+            self.after_cancel(self._filter_poll_after_id)
+            self._filter_poll_after_id = None
+        if self._filter_future is not None:
+            self._filter_future.cancel()
+            self._filter_future = None
+            
+    def _install_filter_result(self, servers: List[SourceServer], indices: List[int]):
+        """Show the servers at the given indices"""
+        self.filtered_servers = [servers[i] for i in indices]
                 
-        return True
+        self._update_server_list()
+        self._update_count_label()
         
-    def _on_search_change(self, event):
-        """Handle search input changes"""
+    def destroy(self):
+        """Stop the filter worker and pending timers before destroying the frame"""
+        for after_id in (self._search_after_id, self._last_seen_after_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._search_after_id = None
+        self._last_seen_after_id = None
+        
+        # cancel_futures needs Python 3.9; only one filter pass is ever outstanding
+        self._cancel_background_filter()
+        self._filter_executor.shutdown(wait=False)
+        super().destroy()
+        
+    def _on_search_change(self, *args):
+        """Handle search text changes (typing, paste, cut)"""
+        search = self.search_var.get()
+        if search == self._last_search:
+            return
+        self._last_search = search
+        self._schedule_filters()
+        
+    def _schedule_filters(self, *args):
+        """Debounce filter passes so rapid input triggers a single refresh"""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(self.FILTER_DEBOUNCE_MS, self._run_scheduled_filters)
+        
+    def _run_scheduled_filters(self):
+        """Run the debounced filter pass"""
+        self._search_after_id = None
         self._apply_filters()
         
     def _update_server_list(self):
         """Update the server list display"""
-        # Clear existing widgets
-        for widget in self.server_widgets:
-            widget.destroy()
-        self.server_widgets.clear()
-        
-        # Create header row
-        header = ServerRowWidget(
-            self.scrollable_frame,
-            is_header=True,
-            on_checkbox_change=None
-        )
-        header.pack(fill="x", padx=5, pady=2)
-        self.server_widgets.append(header)
-        
-        # Create server rows
-        for server in self.filtered_servers:
-            row = ServerRowWidget(
-                self.scrollable_frame,
-                server=server,
-                is_selected=server in self.selected_servers,
-                on_checkbox_change=self._on_server_selection
+        self._update_scrollregion()
+        self._render_visible_rows(force=True)
+        
+    def _update_scrollregion(self):
+        """Size the scrollable area to the full filtered list"""
+        row_height = self._get_row_height()
+        height = len(self.filtered_servers) * row_height
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), height))
+        
+    def _get_row_height(self) -> int:
+        """Measure the row height once from a pooled row"""
+        if self._row_height is None:
+            row = self._get_pooled_row(0)
+            row.update_idletasks()
+            self._row_height = row.winfo_reqheight() + self.ROW_PADDING
+            self.canvas.configure(yscrollincrement=self._row_height)
+        return self._row_height
+        
+    def _get_pooled_row(self, index: int) -> "ServerRowWidget":
+        """Get the pooled row at index, growing the pool if needed"""
+        while len(self._row_pool) <= index:
+            row = ServerRowWidget(self.canvas, on_checkbox_change=self._on_server_selection)
+            window = self.canvas.create_window(
+                0, 0, window=row, anchor="nw",
+                width=self.canvas.winfo_width(), state="hidden"
             )
-            row.pack(fill="x", padx=5, pady=2)
-            self.server_widgets.append(row)
+            self._bind_mousewheel(row)
+            self._row_pool.append(row)
+            self._row_windows.append(window)
+        return self._row_pool[index]
+        
+    def _render_visible_rows(self, force: bool = False):
+        """Bind pooled rows to the servers currently in the viewport"""
+        row_height = self._get_row_height()
+        top = max(0, int(self.canvas.canvasy(0)))
+        first = top // row_height
+        if not force and first == self._first_rendered:
+            return
+        self._first_rendered = first
+        
+        visible_count = self.canvas.winfo_height() // row_height + 1 + self.ROW_BUFFER
+        total = len(self.filtered_servers)
+        for i in range(max(visible_count, len(self._row_pool))):
+            index = first + i
+            if i >= visible_count or index >= total:
+                if i < len(self._row_pool):
+                    self.canvas.itemconfigure(self._row_windows[i], state="hidden")
+                continue
+                
+            server = self.filtered_servers[index]
+            row = self._get_pooled_row(i)
+            server_id = server.source_server_id
+            row.rebind(server, server_id in self._selected, self._last_seen_text.get(server_id))
+            window = self._row_windows[i]
+            self.canvas.coords(window, 0, index * row_height)
+            self.canvas.itemconfigure(window, state="normal")
+            
+    def _on_canvas_yview(self, first, last):
+        """Keep the scrollbar in sync and render rows scrolled into view"""
+        self.scrollbar.set(first, last)
+        self._render_visible_rows()
+        
+    def _on_canvas_configure(self, event):
+        """Stretch rows to the canvas width and fill a resized viewport"""
+        for window in self._row_windows:
+            self.canvas.itemconfigure(window, width=event.width)
+        self._update_scrollregion()
+        self._render_visible_rows(force=True)
+        
+    def _bind_mousewheel(self, widget):
+        """Scroll the list when the wheel is used over widget or its children"""
+        tkinter.Misc.bind(widget, "<MouseWheel>", self._on_mousewheel, "+")
+        tkinter.Misc.bind(widget, "<Button-4>", self._on_mousewheel, "+")
+        tkinter.Misc.bind(widget, "<Button-5>", self._on_mousewheel, "+")
+        for child in widget.winfo_children():
+            self._bind_mousewheel(child)
+            
+    def _on_mousewheel(self, event):
+        """Scroll the canvas by whole rows"""
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        elif event.delta:
+            step = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        else:
+            return
+        self.canvas.yview_scroll(step, "units")
             
     def _update_count_label(self):
         """Update the server count label"""
         total = len(self.servers)
         filtered = len(self.filtered_servers)
-        selected = len(self.selected_servers)
+        selected = len(self._selected)
         
         if total == filtered:
             self.count_label.configure(text=f"({total} servers, {selected} selected)")
@@ -253,36 +541,39 @@ class ServerListFrame(ctk.CTkFrame):
             
     def _select_all(self):
         """Select all visible servers"""
-        self.selected_servers = self.filtered_servers.copy()
+        self._selected = {server.source_server_id: server for server in self.filtered_servers}
         self._update_selection_display()
         self.on_selection_change(self.selected_servers)
         
     def _select_none(self):
         """Deselect all servers"""
-        self.selected_servers.clear()
+        self._selected.clear()
         self._update_selection_display()
         self.on_selection_change(self.selected_servers)
         
     def _on_server_selection(self, server: SourceServer, is_selected: bool):
         """Handle individual server selection"""
-        if is_selected and server not in self.selected_servers:
-            self.selected_servers.append(server)
-        elif not is_selected and server in self.selected_servers:
-            self.selected_servers.remove(server)
+        if is_selected:
+            self._selected[server.source_server_id] = server
+        else:
+            self._selected.pop(server.source_server_id, None)
             
         self._update_selection_display()
         self.on_selection_change(self.selected_servers)
         
     def _update_selection_display(self):
         """Update the visual selection state"""
-        for widget in self.server_widgets[1:]:  # Skip header
-            if hasattr(widget, 'server'):
-                widget.update_selection(widget.server in self.selected_servers)
+        for widget in self._row_pool:
+            if widget.server is not None:
+                widget.update_selection(widget.server.source_server_id in self._selected)
 
 
 class ServerRowWidget(ctk.CTkFrame):
     """Individual server row widget"""
     
+    # (minsize, weight) per column: checkbox, name, status, last seen, test instance
+    COLUMNS = ((40, 0), (250, 1), (200, 0), (120, 0), (120, 0))
+    
     def __init__(self, master, server: Optional[SourceServer] = None, 
                  is_selected: bool = False, is_header: bool = False,
                  on_checkbox_change: Optional[Callable[[SourceServer, bool], None]] = None):
@@ -293,6 +584,9 @@ class ServerRowWidget(ctk.CTkFrame):
         self.on_checkbox_change = on_checkbox_change
         self.is_selected = is_selected
         
+        # Label texts last applied by rebind(), to skip unchanged configure() calls
+        self._bound_texts: Tuple[Optional[str], ...] = (None, None, None, None)
+        
         self._create_widgets()
         
     def _create_widgets(self):
@@ -318,23 +612,47 @@ class ServerRowWidget(ctk.CTkFrame):
             )
             self.checkbox.select() if self.is_selected else self.checkbox.deselect()
             
-            self.name_label = ctk.CTkLabel(self, text=self.server.name)
+            # Pooled rows may be created empty and bound to a server later
+            self.name_label = ctk.CTkLabel(self, text=self.server.name if self.server else "")
             self.status_label = ctk.CTkLabel(self, text=self._get_status_display())
-            self.last_seen_label = ctk.CTkLabel(self, text=self._get_last_seen_display())
+            self.last_seen_label = ctk.CTkLabel(self, text=self._get_last_seen_display() if self.server else "")
             self.instance_label = ctk.CTkLabel(self, text=self._get_instance_display())
             
-        # Layout
-        self.checkbox.pack(side="left", padx=5, pady=5)
-        self.name_label.pack(side="left", padx=10, pady=5, anchor="w")
-        self.status_label.pack(side="left", padx=10, pady=5, anchor="w")
-        self.last_seen_label.pack(side="left", padx=10, pady=5, anchor="w")
-        self.instance_label.pack(side="left", padx=10, pady=5, anchor="w")
+        # Layout: fixed grid columns so labels line up across rows and a
+        # text change in one column does not repack its siblings
+        for column, (minsize, weight) in enumerate(self.COLUMNS):
+            self.grid_columnconfigure(column, minsize=minsize, weight=weight)
+            
+        self.checkbox.grid(row=0, column=0, padx=5, pady=5)
+        for column, label in enumerate(
+            (self.name_label, self.status_label, self.last_seen_label, self.instance_label), start=1
+        ):
+            label.configure(anchor="w")
+            label.grid(row=0, column=column, padx=10, pady=5, sticky="w")
         
     def _on_checkbox_click(self):
         """Handle checkbox click"""
         if self.on_checkbox_change:
             self.on_checkbox_change(self.server, self.checkbox.get())
             
+    def rebind(self, server: SourceServer, is_selected: bool, last_seen_text: Optional[str] = None):
+        """Reuse this row for another server, reconfiguring only what changed"""
+        self.server = server
+        texts = (
+            server.name,
+            self._get_status_display(),
+            last_seen_text if last_seen_text is not None else self._get_last_seen_display(),
+            self._get_instance_display()
+        )
+        labels = (self.name_label, self.status_label, self.last_seen_label, self.instance_label)
+        for label, text, old_text in zip(labels, texts, self._bound_texts):
+            if text != old_text:
+                label.configure(text=text)
+        self._bound_texts = texts
+        
+        if is_selected != self.is_selected:
+            self.update_selection(is_selected)
+            
     def update_selection(self, is_selected: bool):
         """Update selection state"""
         self.is_selected = is_selected
@@ -348,97 +666,14 @@ class ServerRowWidget(ctk.CTkFrame):
         if not self.server:
             return ""
             
-        status_icons = {
-            # Ready states - Green
-            ServerStatus.READY_FOR_TEST: "🟢",
-            ServerStatus.READY_FOR_TESTING: "🟢", 
-            ServerStatus.READY_FOR_CUTOVER: "🟢",
-            
-            # In Progress states - Yellow
-            ServerStatus.TEST_IN_PROGRESS: "🟡",
-            ServerStatus.CUTOVER_IN_PROGRESS: "🟡",
-            
-            # Success states - Blue
-            ServerStatus.TEST_COMPLETE: "🔵",
-            ServerStatus.TEST_COMPLETED: "🔵",
-            ServerStatus.CUTOVER_COMPLETE: "🔵",
-            ServerStatus.CUTOVER_COMPLETED: "🔵",
-            
-            # Failed/Error states - Red
-            ServerStatus.TEST_FAILED: "🔴",
-            ServerStatus.CUTOVER_FAILED: "🔴",
-            ServerStatus.STALLED: "🔴",
-            ServerStatus.ERROR: "🔴",
-            
-            # Other states - Gray
-            ServerStatus.NOT_READY: "⚫",
-            ServerStatus.DISCONNECTED: "⚫",
-            ServerStatus.STOPPED: "⚫",
-            ServerStatus.UNKNOWN: "⚪"
-        }
-        
-        icon = status_icons.get(self.server.status, "⚪")
-        
-        # Create more user-friendly status labels
-        status_labels = {
-            ServerStatus.READY_FOR_TEST: "Ready for Test",
-            ServerStatus.READY_FOR_TESTING: "Ready for Testing", 
-            ServerStatus.READY_FOR_CUTOVER: "Ready for Cutover",
-            ServerStatus.TEST_IN_PROGRESS: "Test in Progress",
-            ServerStatus.CUTOVER_IN_PROGRESS: "Cutover in Progress",
-            ServerStatus.TEST_COMPLETE: "Test Complete",
-            ServerStatus.TEST_COMPLETED: "Test Completed",
-            ServerStatus.CUTOVER_COMPLETE: "Cutover Complete",
-            ServerStatus.CUTOVER_COMPLETED: "Cutover Completed",
-            ServerStatus.TEST_FAILED: "Test Failed",
-            ServerStatus.CUTOVER_FAILED: "Cutover Failed",
-            ServerStatus.NOT_READY: "Not Ready",
-            ServerStatus.DISCONNECTED: "Disconnected",
-            ServerStatus.STALLED: "Stalled",
-            ServerStatus.ERROR: "Error",
-            ServerStatus.STOPPED: "Stopped",
-            ServerStatus.UNKNOWN: "Unknown"
-        }
-        
-        status_text = status_labels.get(self.server.status, self.server.status.value.replace('_', ' ').title())
-        return f"{icon} {status_text}"
+        status = self.server.status
+        return _STATUS_FMT.get(status) or f"⚪ {status.value.replace('_', ' ').title()}"
         
     def _get_last_seen_display(self) -> str:
         """Get formatted last seen display"""
-        if not self.server or not self.server.last_seen_date_time:
+        if not self.server:
             return "Unknown"
-            
-        try:
-            # Get current time in UTC to match AWS timestamps
-            from datetime import timezone
-            now = datetime.now(timezone.utc)
-            
-            # Ensure the server's last seen time is timezone-aware
-            last_seen = self.server.last_seen_date_time
-            if last_seen.tzinfo is None:
-                # If it's naive, assume it's UTC
-                last_seen = last_seen.replace(tzinfo=timezone.utc)
-            
-            diff = now - last_seen
-            
-            if diff.days > 0:
-                return f"{diff.days} day(s) ago"
-            elif diff.seconds > 3600:
-                hours = diff.seconds // 3600
-                return f"{hours} hour(s) ago"
-            elif diff.seconds > 60:
-                minutes = diff.seconds // 60
-                return f"{minutes} min ago"
-            else:
-                return "Just now"
-                
-        except Exception as e:
-            logger.warning(f"Error calculating time difference: {e}")
-            # Fallback to showing the raw timestamp
-            try:
-                return self.server.last_seen_date_time.strftime("%Y-%m-%d %H:%M")
-            except:
-                return "Unknown"
+        return _format_last_seen(self.server.last_seen_date_time, datetime.now(timezone.utc))
             
     def _get_instance_display(self) -> str:
         """Get formatted instance display"""
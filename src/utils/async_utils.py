@@ -3,9 +3,14 @@ Async and Concurrent Utilities
 """
 
 import asyncio
+import functools
+import inspect
+import itertools
 import logging
-from typing import List, Callable, Any, TypeVar, Awaitable, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+from dataclasses import dataclass
+from typing import List, Dict, Set, Tuple, Callable, Any, TypeVar, Awaitable, AsyncIterator, Optional, Literal
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import time
 
 logger = logging.getLogger(__name__)
@@ -13,35 +18,416 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 R = TypeVar('R')
 
+
+@dataclass
+class BulkResult:
+    """Outcome of a bulk operation as parallel per-item lists
+    
+    errors[i] is None when item i succeeded, in which case values[i] holds its
+    result; otherwise errors[i] is the exception and values[i] is None.
+    """
+    values: List[Any]
+    errors: List[Optional[Exception]]
+    ok_count: int
+    
+    @property
+    def fail_count(self) -> int:
+        """Number of items that failed"""
+        return len(self.errors) - self.ok_count
+
+
 class RateLimiter:
-    """Simple rate limiter for API calls"""
+    """Token bucket rate limiter for API calls
+    
+    Allows bursts of up to max_calls and refills at max_calls per time_window.
+    """
     
     def __init__(self, max_calls: int, time_window: float):
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls = []
+        self._rate = max_calls / time_window
+        self._tokens: float = max_calls
+        self._last = time.monotonic()
         
     async def acquire(self):
         """Acquire permission to make a call"""
-        now = time.time()
+        # The refill-and-take below contains no await, so it is atomic with
+        # respect to other coroutines
+        now = time.monotonic()
+        self._tokens = min(self.max_calls, self._tokens + (now - self._last) * self._rate)
+        self._last = now
+        
+        # Reserve a token even when the bucket is empty; the balance goes
+        # negative, so each waiter sleeps exactly once, queued behind earlier
+        # waiters, and never has to re-check after waking
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return
+            
+        sleep_time = -self._tokens / self._rate
+        logger.info(f"Rate limit reached, waiting {sleep_time:.2f} seconds")
+        try:
+            await asyncio.sleep(sleep_time)
+        except asyncio.CancelledError:
+            # Give the reservation back so later callers don't wait for it
+            self._tokens += 1
+            raise
         
-        # Remove old calls outside the time window
-        self.calls = [call_time for call_time in self.calls if now - call_time < self.time_window]
+    def reset(self):
+        """Reset the rate limiter"""
+        self._tokens = self.max_calls
+        self._last = time.monotonic()
+
+
+class StripedRateLimiter:
+    """Independent rate limiters keyed by API endpoint
+    
+    Each key (e.g. "us-east-1:StartTest") gets its own RateLimiter, so calls to
+    one endpoint never wait on another endpoint's quota.
+    """
+    
+    def __init__(self, default_limits: Dict[str, Tuple[int, float]], fallback: Tuple[int, float] = (50, 60.0)):
+        self._limits = dict(default_limits)
+        self._fallback = fallback
+        self._limiters = {key: RateLimiter(*limit) for key, limit in default_limits.items()}
         
-        # If we've made too many calls, wait
-        if len(self.calls) >= self.max_calls:
-            sleep_time = self.time_window - (now - self.calls[0])
-            if sleep_time > 0:
-                logger.info(f"Rate limit reached, waiting {sleep_time:.2f} seconds")
-                await asyncio.sleep(sleep_time)
-                return await self.acquire()
+    def limiter(self, key: str) -> RateLimiter:
+        """Get the limiter for a key, creating it on first use"""
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            # setdefault keeps a single limiter per key even if two threads race here
+            limiter = self._limiters.setdefault(key, RateLimiter(*self._limits.get(key, self._fallback)))
+        return limiter
         
-        # Add current call
-        self.calls.append(time.time())
+    async def acquire(self, key: str):
+        """Acquire permission to make a call to the given endpoint"""
+        await self.limiter(key).acquire()
         
     def reset(self):
-        """Reset the rate limiter"""
-        self.calls.clear()
+        """Reset all limiters"""
+        for limiter in self._limiters.values():
+            limiter.reset()
+
+
+class ConcurrencyLimiter:
+    """Async concurrency cap that can be resized while operations are running
+    
+    Unlike asyncio.Semaphore, the limit can be changed safely with set_limit(),
+    including from another thread's event loop. The limiter binds to the loop
+    of the operation using it; entering it from a second loop while it is in
+    use raises RuntimeError.
+    """
+    
+    def __init__(self, limit: int):
+        self._limit = limit
+        # Coroutines holding or waiting for a slot
+        self._users = 0
+        self._active = 0
+        self._cond: Optional[asyncio.Condition] = None
+        self._cond_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit"""
+        return self._limit
+        
+    def _get_condition(self) -> asyncio.Condition:
+        """Get the condition for the running loop (asyncio primitives are loop-bound)"""
+        loop = asyncio.get_running_loop()
+        if self._cond_loop is not loop:
+            if self._users:
+                raise RuntimeError("ConcurrencyLimiter is already in use on another event loop")
+            self._cond = asyncio.Condition()
+            self._cond_loop = loop
+        return self._cond
+        
+    async def set_limit(self, limit: int):
+        """Change the limit and wake any waiters that may now proceed"""
+        if limit < 1:
+            raise ValueError(f"Concurrency limit must be at least 1, got {limit}")
+        self._limit = limit
+        
+        # Waiters re-check the limit when notified; with none there is nothing to wake
+        loop = self._cond_loop
+        if not self._users:
+            return
+        if loop is asyncio.get_running_loop():
+            await self._notify_waiters()
+        else:
+            # The waiters belong to the operation's loop, so notify them there
+            loop.call_soon_threadsafe(loop.create_task, self._notify_waiters())
+            
+    async def _notify_waiters(self):
+        """Wake all waiters so they re-check the limit"""
+        cond = self._get_condition()
+        async with cond:
+            cond.notify_all()
+            
+    async def __aenter__(self):
+        """Wait for a free slot"""
+        cond = self._get_condition()
+        self._users += 1
+        try:
+            async with cond:
+                await cond.wait_for(lambda: self._active < self._limit)
+                self._active += 1
+        except BaseException:
+            self._users -= 1
+            raise
+            
+    async def __aexit__(self, exc_type, exc, tb):
+        """Release the slot"""
+        cond = self._get_condition()
+        async with cond:
+            self._active -= 1
+            self._users -= 1
+            cond.notify(1)
+
+
+class _NoLimit:
+    """Async context manager that imposes no concurrency limit"""
+    
+    async def __aenter__(self):
+        return None
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+_NO_LIMIT = _NoLimit()
+
+
+class _ProgressReporter:
+    """Counts completed items and forwards throttled progress to an optional callback
+    
+    Safe to advance from worker threads: next() on itertools.count is atomic in
+    CPython, unlike an integer += 1, so no two items report the same count.
+    Errors raised by the callback are logged, never allowed to stop the run.
+    """
+    
+    # Minimum seconds between callbacks, unless a step boundary is reached
+    MIN_INTERVAL = 0.05
+    
+    def __init__(self, callback: Optional[Callable[[int, int], None]], total: int):
+        self.callback = callback
+        self.total = total
+        self._counter = itertools.count(1)
+        
+        # Report about 200 times over the whole run, plus the final count
+        self._step = max(1, total // 200)
+        self._last_emit = 0.0
+        
+    def advance(self):
+        """Record one completed item"""
+        done = next(self._counter)
+        if not self.callback:
+            return
+            
+        now = time.monotonic()
+        if done == self.total or done % self._step == 0 or now - self._last_emit > self.MIN_INTERVAL:
+            self._last_emit = now
+            try:
+                self.callback(done, self.total)
+            except Exception as e:
+                logger.error(f"Progress callback failed at {done}/{self.total}: {e}")
+
+
+async def _call_item(
+    func: Callable[[T], R],
+    item: Any,
+    is_async: bool,
+    loop: asyncio.AbstractEventLoop,
+    rate_limit: Optional[RateLimiter],
+    executor: Optional[Executor],
+    concurrency: Optional[ConcurrencyLimiter]
+) -> Any:
+    """Run func on one item (or batch) under the concurrency and rate limits"""
+    async with concurrency or _NO_LIMIT:
+        if rate_limit:
+            await rate_limit.acquire()
+            
+        if is_async:
+            return await func(item)
+        return await loop.run_in_executor(executor, func, item)
+
+
+def _check_batch_size(batch_size: int):
+    """Reject batch sizes that can't split the items into jobs"""
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+
+async def _produce_jobs(
+    queue: "asyncio.Queue[Optional[tuple[int, Any]]]",
+    items: List[Any],
+    batch_size: int,
+    worker_count: int
+):
+    """Feed (index, item) jobs, or (start, batch) when batching, then one None per worker"""
+    if batch_size > 1:
+        for start in range(0, len(items), batch_size):
+            await queue.put((start, items[start:start + batch_size]))
+    else:
+        for i, item in enumerate(items):
+            await queue.put((i, item))
+            
+    for _ in range(worker_count):
+        await queue.put(None)
+
+
+async def _rate_limited_worker(
+    queue: "asyncio.Queue[Optional[tuple[int, Any]]]",
+    out: "asyncio.Queue[tuple[int, bool, Any]]",
+    func: Callable[[T], R],
+    is_async: bool,
+    loop: asyncio.AbstractEventLoop,
+    rate_limit: Optional[RateLimiter],
+    executor: Optional[Executor],
+    concurrency: Optional[ConcurrencyLimiter],
+    progress: _ProgressReporter,
+    batched: bool = False
+):
+    """
+    Process queued (index, item) pairs until a None sentinel, emitting (index, ok, value) to out
+    
+    ok says whether value is the item's result or the exception it failed with.
+    
+    When batched, each queued item is a list of consecutive items starting at
+    index; func gets the whole list and must return one result per item.
+    
+    An error outside the per-item handling, such as a CancelledError or other
+    BaseException raised by func, is emitted as (-1, False, exc) and stops the
+    worker. Progress is advanced before an item's result is emitted, so that
+    item's result is never emitted and the consumer always reaches the marker
+    before it has read every result.
+    """
+    try:
+        await _process_jobs(queue, out, func, is_async, loop, rate_limit, executor, concurrency, progress, batched)
+    except BaseException as e:
+        out.put_nowait((-1, False, e))
+        if not isinstance(e, Exception):
+            raise
+
+
+async def _process_jobs(
+    queue: "asyncio.Queue[Optional[tuple[int, Any]]]",
+    out: "asyncio.Queue[tuple[int, bool, Any]]",
+    func: Callable[[T], R],
+    is_async: bool,
+    loop: asyncio.AbstractEventLoop,
+    rate_limit: Optional[RateLimiter],
+    executor: Optional[Executor],
+    concurrency: Optional[ConcurrencyLimiter],
+    progress: _ProgressReporter,
+    batched: bool
+):
+    """Worker loop of _rate_limited_worker"""
+    log_error = logger.error
+    
+    while True:
+        job = await queue.get()
+        if job is None:
+            return
+        index, item = job
+            
+        try:
+            result = await _call_item(func, item, is_async, loop, rate_limit, executor, concurrency)
+            if batched and not (isinstance(result, list) and len(result) == len(item)):
+                got = f"{len(result)} results" if isinstance(result, list) else type(result).__name__
+                raise ValueError(f"Batch function returned {got} for {len(item)} items")
+            ok = True
+        except Exception as e:
+            log_error(f"Error processing item {index}: {e}")
+            # A failed call fails every item in its batch
+            result = [e] * len(item) if batched else e
+            ok = False
+            
+        if batched:
+            for offset, item_result in enumerate(result):
+                progress.advance()
+                out.put_nowait((index + offset, ok, item_result))
+        else:
+            progress.advance()
+            out.put_nowait((index, ok, result))
+
+
+async def _iter_outcomes(
+    func: Callable[[T], R],
+    items: List[T],
+    max_concurrent: int = 10,
+    rate_limit: Optional[RateLimiter] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    executor: Optional[Executor] = None,
+    concurrency: Optional[ConcurrencyLimiter] = None,
+    batch_size: int = 1
+) -> AsyncIterator[Tuple[int, bool, Any]]:
+    """Run the worker pool, yielding (index, ok, value) as items finish"""
+    _check_batch_size(batch_size)
+    loop = asyncio.get_running_loop()
+    total = len(items)
+    progress = _ProgressReporter(progress_callback, total)
+    
+    # Coroutine functions are awaited in place; only blocking calls need a thread
+    is_async = inspect.iscoroutinefunction(func)
+    
+    # A fixed set of long-lived workers pulls jobs from a bounded queue fed by
+    # a producer, so neither coroutine frames nor queued jobs grow with the
+    # number of items
+    batched = batch_size > 1
+    job_count = -(-total // batch_size)
+    worker_count = min(max_concurrent, job_count)
+    queue: "asyncio.Queue[Optional[tuple[int, Any]]]" = asyncio.Queue(maxsize=max_concurrent * 2)
+    producer = loop.create_task(_produce_jobs(queue, items, batch_size, worker_count))
+    out: "asyncio.Queue[tuple[int, bool, Any]]" = asyncio.Queue()
+    
+    workers = [
+        loop.create_task(_rate_limited_worker(
+            queue, out, func, is_async, loop, rate_limit, executor, concurrency, progress, batched
+        ))
+        for _ in range(worker_count)
+    ]
+    
+    try:
+        for _ in range(total):
+            index, ok, value = await out.get()
+            if index < 0:
+                raise value
+            yield index, ok, value
+    finally:
+        producer.cancel()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(producer, *workers, return_exceptions=True)
+
+
+async def iter_concurrent_with_rate_limit(
+    func: Callable[[T], R],
+    items: List[T],
+    max_concurrent: int = 10,
+    rate_limit: Optional[RateLimiter] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    executor: Optional[Executor] = None,
+    concurrency: Optional[ConcurrencyLimiter] = None,
+    batch_size: int = 1
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Run a function concurrently on a list of items, yielding results as they finish
+    
+    Takes the same arguments as run_concurrent_with_rate_limit. Stopping early
+    cancels the remaining work once the generator is closed (aclose()).
+    
+    Yields:
+        (index, result) pairs in completion order; result is the exception
+        if processing that item failed
+    """
+    outcomes = _iter_outcomes(
+        func, items, max_concurrent, rate_limit, progress_callback, executor, concurrency, batch_size
+    )
+    try:
+        async for index, _ok, value in outcomes:
+            yield index, value
+    finally:
+        await outcomes.aclose()
 
 
 async def run_concurrent_with_rate_limit(
@@ -49,171 +435,267 @@ async def run_concurrent_with_rate_limit(
     items: List[T],
     max_concurrent: int = 10,
     rate_limit: Optional[RateLimiter] = None,
-    progress_callback: Optional[Callable[[int, int], None]] = None
-) -> List[R]:
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    executor: Optional[Executor] = None,
+    concurrency: Optional[ConcurrencyLimiter] = None,
+    batch_size: int = 1
+) -> BulkResult:
     """
     Run a function concurrently on a list of items with rate limiting
     
     Args:
-        func: Function to run on each item
+        func: Function to run on each item; coroutine functions are awaited
+            directly, plain functions run in the executor
         items: List of items to process
         max_concurrent: Maximum number of concurrent operations
         rate_limit: Optional rate limiter
         progress_callback: Optional callback for progress updates
+        executor: Executor to run func in (defaults to the loop's default executor)
+        concurrency: Optional resizable limit applied on top of max_concurrent
+        batch_size: Items per call; above 1, func receives a list of up to
+            batch_size items and must return a list of results in the same
+            order. Each batch takes one rate limit token.
         
     Returns:
-        List of results in the same order as input items
+        BulkResult with values and errors in the same order as input items
     """
-    results = [None] * len(items)
-    completed = 0
-    
-    async def process_item(index: int, item: T) -> tuple[int, R]:
-        """Process a single item"""
-        nonlocal completed
+    _check_batch_size(batch_size)
+    loop = asyncio.get_running_loop()
+    if not items:
+        return BulkResult([], [], 0)
         
-        if rate_limit:
-            await rate_limit.acquire()
-            
+    # Acting on a single selected server is the common case; call it directly
+    # rather than setting up the queue and worker task
+    if len(items) == 1 and batch_size == 1:
+        single = BulkResult([None], [None], 0)
         try:
-            result = await asyncio.get_event_loop().run_in_executor(None, func, item)
-            return index, result
+            single.values[0] = await _call_item(
+                func, items[0], inspect.iscoroutinefunction(func), loop,
+                rate_limit, executor, concurrency
+            )
+            single.ok_count = 1
         except Exception as e:
-            logger.error(f"Error processing item {index}: {e}")
-            raise
-        finally:
-            completed += 1
-            if progress_callback:
-                progress_callback(completed, len(items))
-    
-    # Create semaphore to limit concurrency
-    semaphore = asyncio.Semaphore(max_concurrent)
-    
-    async def process_with_semaphore(index: int, item: T) -> tuple[int, R]:
-        """Process item with semaphore"""
-        async with semaphore:
-            return await process_item(index, item)
-    
-    # Create tasks
-    tasks = [
-        process_with_semaphore(i, item)
-        for i, item in enumerate(items)
-    ]
+            logger.error(f"Error processing item 0: {e}")
+            single.errors[0] = e
+        _ProgressReporter(progress_callback, 1).advance()
+        return single
+        
+    total = len(items)
+    values: List[Any] = [None] * total
+    errors: List[Optional[Exception]] = [None] * total
+    ok_count = 0
     
-    # Wait for all tasks to complete
-    for task in asyncio.as_completed(tasks):
-        try:
-            index, result = await task
-            results[index] = result
-        except Exception as e:
-            logger.error(f"Task failed: {e}")
-            # Find the failed task and mark it as failed
-            for i, item in enumerate(items):
-                if results[i] is None:
-                    results[i] = e
-                    break
+    # The worker reports success explicitly, so a function that returns an
+    # exception object is still counted as a success
+    async for index, ok, value in _iter_outcomes(
+        func, items, max_concurrent, rate_limit, progress_callback, executor, concurrency, batch_size
+    ):
+        if ok:
+            values[index] = value
+            ok_count += 1
+        else:
+            errors[index] = value
     
-    return results
+    # The iterator yields exactly one result per item, or raises
+    return BulkResult(values, errors, ok_count)
+
+
+def _call_capturing(func: Callable[[T], R], index: int, item: T) -> Any:
+    """Call func, returning the exception instead of raising it (module level so it pickles)"""
+    try:
+        return func(item)
+    except Exception as e:
+        logger.error(f"Error processing item {index}: {e}")
+        return e
 
 
 def run_concurrent_sync(
     func: Callable[[T], R],
     items: List[T],
-    max_workers: int = 10,
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    mode: Literal["io", "cpu"] = "io"
 ) -> List[R]:
     """
-    Run a function concurrently using ThreadPoolExecutor
+    Run a function concurrently using a thread or process pool
+    
+    Threads are right for I/O-bound work such as API calls: they are cheap and
+    share memory, but the GIL serializes pure-Python computation. Processes
+    parallelize CPU-bound work across cores at the cost of a separate
+    interpreter (tens of MB) per worker and pickling every item and result.
     
     Args:
-        func: Function to run on each item
+        func: Function to run on each item (must be picklable in "cpu" mode)
         items: List of items to process
-        max_workers: Maximum number of worker threads
+        max_workers: Maximum number of workers (defaults to 32 for "io" and
+            the CPU count for "cpu")
         progress_callback: Optional callback for progress updates
+        mode: "io" to use a ThreadPoolExecutor, "cpu" for a ProcessPoolExecutor
         
     Returns:
         List of results in the same order as input items
     """
-    results = [None] * len(items)
-    completed = 0
-    
-    def process_item(index: int, item: T) -> tuple[int, R]:
-        """Process a single item"""
-        nonlocal completed
+    if mode not in ("io", "cpu"):
+        raise ValueError(f"mode must be 'io' or 'cpu', got {mode!r}")
+    if not items:
+        return []
         
+    # A single item runs inline; pool setup and teardown would dominate it
+    if len(items) == 1:
         try:
-            result = func(item)
-            return index, result
+            result = func(items[0])
         except Exception as e:
-            logger.error(f"Error processing item {index}: {e}")
-            raise
-        finally:
-            completed += 1
-            if progress_callback:
-                progress_callback(completed, len(items))
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
+            logger.error(f"Error processing item 0: {e}")
+            result = e
+        _ProgressReporter(progress_callback, 1).advance()
+        return [result]
+        
+    total = len(items)
+    if mode == "cpu":
+        max_workers = max_workers or os.cpu_count()
+        executor: Executor = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        max_workers = max_workers or 32
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        
+    with executor:
+        # Without progress reporting there is nothing to do per completion, so
+        # let map() return results in input order without any index bookkeeping.
+        # chunksize only affects processes, where it amortizes pickling and IPC.
+        if progress_callback is None:
+            return list(executor.map(
+                functools.partial(_call_capturing, func), range(total), items,
+                chunksize=max(1, total // (max_workers * 4))
+            ))
+            
+        log_error = logger.error
+        results: List[Any] = [None] * total
+        progress = _ProgressReporter(progress_callback, total)
+        
+        # func is submitted as-is (so it pickles for processes); failures are
+        # read back from the future instead of being caught in the worker
         future_to_index = {
-            executor.submit(process_item, i, item): i
+            executor.submit(func, item): i
             for i, item in enumerate(items)
         }
         
         # Collect results
         for future in as_completed(future_to_index):
-            try:
-                index, result = future.result()
-                results[index] = result
-            except Exception as e:
-                logger.error(f"Task failed: {e}")
-                # Mark the failed task
-                index = future_to_index[future]
-                results[index] = e
+            index = future_to_index[future]
+            exc = future.exception()
+            if exc is None:
+                results[index] = future.result()
+            else:
+                log_error(f"Error processing item {index}: {exc}")
+                results[index] = exc
+            progress.advance()
     
+    # as_completed visits every future, so every slot is filled
     return results
 
 
 class BulkOperationManager:
     """Manager for bulk operations with progress tracking"""
     
-    def __init__(self, max_concurrent: int = 10, rate_limit_calls: int = 50, rate_limit_window: float = 60.0):
+    def __init__(
+        self,
+        max_concurrent: int = 10,
+        rate_limit_calls: int = 50,
+        rate_limit_window: float = 60.0,
+        rate_limits: Optional[Dict[str, Tuple[int, float]]] = None
+    ):
         self.max_concurrent = max_concurrent
         self.rate_limiter = RateLimiter(rate_limit_calls, rate_limit_window)
         
+        # Per-endpoint limiters for operations tagged with an api_key; unknown
+        # keys get the same limits as the shared limiter
+        self.rate_limiters = StripedRateLimiter(rate_limits or {}, (rate_limit_calls, rate_limit_window))
+        
+        # Dedicated threads sized to max_concurrent, so bulk operations neither
+        # contend with nor depend on the size of the loop's default executor
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="mgn-bulk")
+        
+        # Each operation gets its own resizable cap (bound to the loop running
+        # it); set_limit() resizes all of them so they can back off under throttling
+        self._limit = max_concurrent
+        self._running_limiters: Set[ConcurrencyLimiter] = set()
+        
+    async def set_limit(self, limit: int):
+        """
+        Change how many items run concurrently, including in running operations
+        
+        The limit applies to each operation separately. It can be lowered freely
+        and raised back up to max_concurrent, which bounds the number of workers.
+        """
+        if limit < 1:
+            raise ValueError(f"Concurrency limit must be at least 1, got {limit}")
+        self._limit = min(limit, self.max_concurrent)
+        for limiter in list(self._running_limiters):
+            await limiter.set_limit(self._limit)
+        
+    def close(self):
+        """Shut down the worker threads, blocking until in-flight calls finish (synchronous callers only)"""
+        self._executor.shutdown(wait=True)
+        
+    async def aclose(self):
+        """Shut down the worker threads without blocking the event loop"""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+        
+    async def __aenter__(self) -> "BulkOperationManager":
+        """Use the manager as an async context manager"""
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        """Shut down the worker threads on exit"""
+        await self.aclose()
+        
     async def execute_bulk_operation(
         self,
         operation_func: Callable[[T], R],
         items: List[T],
-        progress_callback: Optional[Callable[[int, int], None]] = None
-    ) -> List[R]:
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        api_key: Optional[str] = None,
+        batch_size: int = 1
+    ) -> BulkResult:
         """
         Execute a bulk operation with rate limiting and progress tracking
         
         Args:
-            operation_func: Function to execute on each item
+            operation_func: Function to execute on each item, either a plain
+                (blocking) function or an async function
             items: List of items to process
             progress_callback: Optional progress callback
+            api_key: Endpoint the operation calls, e.g. "us-east-1:StartTest";
+                rate limited independently of other endpoints when given
+            batch_size: Items per call for APIs that take several servers at
+                once, e.g. MGN DescribeSourceServers with a sourceServerIDs
+                filter; operation_func then receives and returns lists
             
         Returns:
-            List of results
+            BulkResult with per-item values and errors
         """
         logger.info(f"Starting bulk operation on {len(items)} items with max {self.max_concurrent} concurrent")
         
-        start_time = time.time()
-        results = await run_concurrent_with_rate_limit(
-            operation_func,
-            items,
-            max_concurrent=self.max_concurrent,
-            rate_limit=self.rate_limiter,
-            progress_callback=progress_callback
-        )
+        start_time = time.monotonic()
+        concurrency = ConcurrencyLimiter(self._limit)
+        self._running_limiters.add(concurrency)
+        try:
+            result = await run_concurrent_with_rate_limit(
+                operation_func,
+                items,
+                max_concurrent=self.max_concurrent,
+                rate_limit=self.rate_limiter if api_key is None else self.rate_limiters.limiter(api_key),
+                progress_callback=progress_callback,
+                executor=self._executor,
+                concurrency=concurrency,
+                batch_size=batch_size
+            )
+        finally:
+            self._running_limiters.discard(concurrency)
         
-        end_time = time.time()
+        end_time = time.monotonic()
         duration = end_time - start_time
         
-        # Count successes and failures
-        successes = sum(1 for r in results if not isinstance(r, Exception))
-        failures = len(results) - successes
-        
-        logger.info(f"Bulk operation completed in {duration:.2f}s: {successes} success, {failures} failed")
+        logger.info(f"Bulk operation completed in {duration:.2f}s: {result.ok_count} success, {result.fail_count} failed")
         
-        return results 
\ No newline at end of file
+        return result 
\ No newline at end of file